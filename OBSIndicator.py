@@ -1,4 +1,5 @@
 import ctypes
+import json
 import logging
 import math
 import os
@@ -17,10 +18,11 @@ HAS_PYSIDE = False
 HAS_QTSOUND = False
 try:
     from PySide2.QtWidgets import QApplication, QWidget
-    from PySide2.QtCore import (Qt, QTimer, QPoint, QRect, QObject, Signal,
-                                QPointF, QRectF, QMetaObject, QUrl)
-    from PySide2.QtGui import (QPainter, QColor, QBrush, QPen, QPainterPath,
-                               QGuiApplication, QPaintEvent)
+    from PySide2.QtCore import (Qt, QTimer, QRect, QObject, Signal,
+                                QPointF, QRectF, QLineF, QMetaObject, QUrl)
+    from PySide2.QtGui import (QPainter, QColor, QBrush, QPen,
+                               QGuiApplication, QPaintEvent, QPixmap,
+                               QShowEvent, QHideEvent)
 
     try:
         from PySide2.QtMultimedia import QSoundEffect
@@ -36,6 +38,19 @@ except ImportError:
 overlay_app: Optional['OverlayApp'] = None
 gui_thread: Optional[threading.Thread] = None
 
+_user32 = None
+if os.name == 'nt':
+    from ctypes import wintypes
+
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _user32.SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                                     ctypes.c_int, ctypes.c_int, wintypes.UINT]
+    _user32.SetWindowPos.restype = wintypes.BOOL
+    _user32.GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+    _user32.GetWindowLongW.restype = wintypes.LONG
+    _user32.SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.LONG]
+    _user32.SetWindowLongW.restype = wintypes.LONG
+
 
 class Corner(Enum):
     TOP_LEFT = "top-left"
@@ -45,15 +60,28 @@ class Corner(Enum):
     OFF = "off"
 
 
+_CORNER_ID = {corner.value: index for index, corner in enumerate(Corner)}
+_CORNER_OFF_ID = _CORNER_ID[Corner.OFF.value]
+
+
 class Shape(Enum):
     CIRCLE = "circle"
     SQUARE = "square"
     ROUNDED = "rounded"
 
 
+_SHAPE_ID = {shape.value: index for index, shape in enumerate(Shape)}
+_SHAPE_CIRCLE_ID = _SHAPE_ID[Shape.CIRCLE.value]
+_SHAPE_SQUARE_ID = _SHAPE_ID[Shape.SQUARE.value]
+
+
 class Animation:
     SPEED = 0.15
     FRAME_INTERVAL_MS = 16
+    # Exponential rate chosen so one nominal 16 ms frame advances by SPEED,
+    # keeping the animation pace independent of the actual tick cadence.
+    SPEED_RATE = -math.log(1.0 - SPEED) / (FRAME_INTERVAL_MS / 1000.0)
+    MAX_FRAME_TIME = 0.1
     SNAP_THRESHOLD = 0.01
     POSITION_SNAP_THRESHOLD = 0.5
 
@@ -61,7 +89,7 @@ class Animation:
 class Timeouts:
     THREAD_JOIN = 2.0
     INITIAL_STATE_DELAY_MS = 200
-    SCREEN_GEOMETRY_CHECK_MS = 1000
+    SETTINGS_DEBOUNCE_MS = 32
 
 
 class Draw:
@@ -99,6 +127,17 @@ DEFAULT_SETTINGS = {
     "save_sound_volume": 100,
 }
 
+# Which cached artifacts each settings key can invalidate; used by
+# on_settings_updated to skip rebuild work for unrelated keys.
+_VISUAL_SETTING_KEYS = frozenset((
+    "size", "opacity", "bg_opacity", "bg_size_percent", "indicator_shape", "bg_shape",
+    "rec_color", "rec_pause_color", "buf_color", "buf_saved_color", "flash_color",
+    "rec_border_color", "rec_pause_border_color", "buf_border_color", "buf_save_border_color",
+    "border_width",
+))
+_LAYOUT_SETTING_KEYS = frozenset(("size", "margin", "bg_size_percent", "corner_rec", "corner_buf"))
+_SOUND_SETTING_KEYS = frozenset(("save_sound_path", "save_sound_volume"))
+
 STRINGS = {
     "description": "Animated indicators for recording and replay buffer.",
     "size": "Indicator Size", "margin": "Margin from Edge", "opacity": "Opacity (%)",
@@ -139,11 +178,38 @@ def rgb_to_obs_color(rgb_color: int) -> int:
     return (0xFF << 24) | ((rgb_color & 0xFF) << 16) | (rgb_color & 0xFF00) | ((rgb_color >> 16) & 0xFF)
 
 
+def _build_setting_accessors() -> Dict[str, Tuple[Any, Any, Any]]:
+    """Map each settings key to (obs getter, obs default-setter, default value).
+
+    Built once at import so script_defaults and get_settings_from_obs do not
+    re-run the type dispatch per key on every call. Color defaults are stored
+    pre-converted to the OBS integer format.
+    """
+    accessors = {}
+    for key, value in DEFAULT_SETTINGS.items():
+        if key.endswith("_color"):
+            entry = (obs.obs_data_get_int, obs.obs_data_set_default_int, rgb_to_obs_color(value))
+        elif isinstance(value, bool):
+            entry = (obs.obs_data_get_bool, obs.obs_data_set_default_bool, value)
+        elif isinstance(value, float):
+            entry = (obs.obs_data_get_double, obs.obs_data_set_default_double, value)
+        elif isinstance(value, int):
+            entry = (obs.obs_data_get_int, obs.obs_data_set_default_int, value)
+        else:
+            entry = (obs.obs_data_get_string, obs.obs_data_set_default_string, value)
+        accessors[key] = entry
+    return accessors
+
+
+_SETTING_ACCESSORS = _build_setting_accessors()
+_COLOR_KEYS = tuple(key for key in DEFAULT_SETTINGS if key.endswith("_color"))
+
+
 def lerp(start: float, end: float, alpha: float) -> float:
     return start + (end - start) * alpha
 
 
-def ease_in_out_cubic(t: float) -> float:
+def _ease_in_out_cubic(t: float) -> float:
     t *= 2
     if t < 1:
         return 0.5 * t * t * t
@@ -151,16 +217,37 @@ def ease_in_out_cubic(t: float) -> float:
     return 0.5 * (t * t * t + 2)
 
 
-def ease_out_cubic(t: float) -> float:
+def _ease_out_cubic(t: float) -> float:
     t -= 1.0
     return t * t * t + 1.0
 
 
+_EASE_LUT_LAST = 255
+_EASE_IN_OUT_CUBIC_LUT = tuple(_ease_in_out_cubic(i / _EASE_LUT_LAST) for i in range(_EASE_LUT_LAST + 1))
+_EASE_OUT_CUBIC_LUT = tuple(_ease_out_cubic(i / _EASE_LUT_LAST) for i in range(_EASE_LUT_LAST + 1))
+
+
+def ease_in_out_cubic(t: float) -> float:
+    if 0.0 <= t <= 1.0:
+        return _EASE_IN_OUT_CUBIC_LUT[int(t * _EASE_LUT_LAST)]
+    return _ease_in_out_cubic(t)
+
+
+def ease_out_cubic(t: float) -> float:
+    if 0.0 <= t <= 1.0:
+        return _EASE_OUT_CUBIC_LUT[int(t * _EASE_LUT_LAST)]
+    return _ease_out_cubic(t)
+
+
 if HAS_PYSIDE:
-    @dataclass
     class AnimatedValue:
-        current: float = 0.0
-        target: float = 0.0
+        # Hot-path object: slots avoid a per-instance __dict__ and speed up
+        # the attribute access done every animation frame.
+        __slots__ = ("current", "target")
+
+        def __init__(self, current: float = 0.0, target: float = 0.0) -> None:
+            self.current = current
+            self.target = target
 
         def set_target(self, new_target: float, immediate: bool = False) -> None:
             self.target = float(new_target)
@@ -182,8 +269,17 @@ if HAS_PYSIDE:
         name: str
         active: bool = False
         visibility: AnimatedValue = field(default_factory=AnimatedValue)
-        position: QPointF = field(default_factory=QPointF)
-        target_position: QPointF = field(default_factory=QPointF)
+        # Animated position as plain scalars; QPointF wrappers proved pure
+        # churn on the 60 Hz path. has_target is False while the corner is
+        # off (the old "null target" convention).
+        pos_x: float = 0.0
+        pos_y: float = 0.0
+        tgt_x: float = 0.0
+        tgt_y: float = 0.0
+        has_target: bool = False
+
+        def dim_factor(self) -> float:
+            return 1.0
 
 
     @dataclass
@@ -193,6 +289,20 @@ if HAS_PYSIDE:
         pause_icon: AnimatedValue = field(default_factory=AnimatedValue)
         border_width: AnimatedValue = field(default_factory=AnimatedValue)
 
+        def icon_progress(self) -> float:
+            return self.pause_icon.current
+
+        def paint(self, overlay: 'OverlayWindow', painter: 'QPainter', x: int, y: int,
+                  master_anim: float, dim_factor: float) -> None:
+            cfg = overlay._cfg
+            pause_progress = self.pause_icon.current
+            main_opacity = 1.0 - pause_progress
+
+            if pause_progress > Animation.SNAP_THRESHOLD:
+                overlay._draw_pause_icon(painter, x, y, pause_progress, master_anim, cfg.rec_pause_color)
+            if main_opacity > Animation.SNAP_THRESHOLD:
+                overlay._draw_indicator(painter, x, y, master_anim, cfg.rec_color, main_opacity)
+
 
     @dataclass
     class BufferState(IndicatorState):
@@ -206,11 +316,106 @@ if HAS_PYSIDE:
         border_width: AnimatedValue = field(default_factory=AnimatedValue)
         save_border_width: AnimatedValue = field(default_factory=AnimatedValue)
 
+        def dim_factor(self) -> float:
+            return self.dim_effect.current
+
+        def icon_progress(self) -> float:
+            return self.checkmark_icon.current
+
+        def paint(self, overlay: 'OverlayWindow', painter: 'QPainter', x: int, y: int,
+                  master_anim: float, dim_factor: float) -> None:
+            cfg = overlay._cfg
+            checkmark_progress = self.checkmark_icon.current
+            main_opacity = 1.0 - checkmark_progress
+
+            if main_opacity > Animation.SNAP_THRESHOLD:
+                overlay._draw_indicator(painter, x, y, master_anim, cfg.buf_color,
+                                        main_opacity * dim_factor)
+            if checkmark_progress > Animation.SNAP_THRESHOLD:
+                overlay._draw_checkmark(painter, x, y, checkmark_progress, master_anim,
+                                        cfg.buf_saved_color, dim_factor)
+
+
+    @dataclass
+    class OverlayConfig:
+        """Settings-derived constants, rebuilt only when settings change."""
+        size: int
+        margin: int
+        bg_size: int
+        opacity: float
+        bg_opacity: float
+        indicator_shape: int
+        bg_shape: int
+        corner_rec: str
+        corner_buf: str
+        fade_effect: bool
+        smooth_position: bool
+        animate_pause: bool
+        animate_checkmark: bool
+        checkmark_duration: float
+        flash_on_save: bool
+        flash_color: int
+        flash_duration: float
+        border_width: int
+        rec_color: int
+        rec_pause_color: int
+        buf_color: int
+        buf_saved_color: int
+        rec_border_enabled: bool
+        rec_pause_border_enabled: bool
+        rec_border_color: int
+        rec_pause_border_color: int
+        buf_border_enabled: bool
+        buf_save_border_enabled: bool
+        buf_border_color: int
+        buf_save_border_color: int
+        check_coords: Tuple[float, ...]
+        check_pen_width: int
+
+        @classmethod
+        def from_settings(cls, s: Dict[str, Any]) -> 'OverlayConfig':
+            size = s["size"]
+            check_p1 = Draw.CHECKMARK_P1 * size
+            check_p2 = Draw.CHECKMARK_P2 * size
+            check_p3 = Draw.CHECKMARK_P3 * size
+            return cls(
+                size=s["size"], margin=s["margin"],
+                bg_size=int(s["size"] * s["bg_size_percent"] / 100),
+                opacity=s["opacity"] / 100.0, bg_opacity=s["bg_opacity"] / 100.0,
+                indicator_shape=_SHAPE_ID.get(s["indicator_shape"], _SHAPE_CIRCLE_ID),
+                bg_shape=_SHAPE_ID.get(s["bg_shape"], _SHAPE_CIRCLE_ID),
+                corner_rec=s["corner_rec"], corner_buf=s["corner_buf"],
+                fade_effect=s["fade_effect"], smooth_position=s["smooth_position"],
+                animate_pause=s["animate_pause"], animate_checkmark=s["animate_checkmark"],
+                checkmark_duration=s["checkmark_duration"],
+                flash_on_save=s["flash_on_save"], flash_color=s["flash_color"],
+                flash_duration=s["flash_duration"], border_width=s["border_width"],
+                rec_color=s["rec_color"], rec_pause_color=s["rec_pause_color"],
+                buf_color=s["buf_color"], buf_saved_color=s["buf_saved_color"],
+                rec_border_enabled=s["rec_border_enabled"],
+                rec_pause_border_enabled=s["rec_pause_border_enabled"],
+                rec_border_color=s["rec_border_color"],
+                rec_pause_border_color=s["rec_pause_border_color"],
+                buf_border_enabled=s["buf_border_enabled"],
+                buf_save_border_enabled=s["buf_save_border_enabled"],
+                buf_border_color=s["buf_border_color"],
+                buf_save_border_color=s["buf_save_border_color"],
+                check_coords=(check_p1.x(), check_p1.y(),
+                              check_p2.x(), check_p2.y(),
+                              check_p3.x(), check_p3.y(),
+                              check_p2.x() - check_p1.x(), check_p2.y() - check_p1.y(),
+                              check_p3.x() - check_p2.x(), check_p3.y() - check_p2.y()),
+                check_pen_width=max(2, int(size * Draw.CHECKMARK_PEN_WIDTH_RATIO)),
+            )
+
 
 if HAS_PYSIDE:
     class SignalEmitter(QObject):
+        __slots__ = ()
+
         rec_status_changed = Signal(bool, bool)
         buf_status_changed = Signal(bool, bool)
+        initial_state = Signal(bool, bool, bool)
         settings_updated = Signal(dict)
 
 
@@ -219,61 +424,92 @@ if HAS_PYSIDE:
             super().__init__()
             self.emitter = emitter
             self.settings = initial_settings
+            self._cfg = OverlayConfig.from_settings(initial_settings)
             self.closing = False
-            self.positions_cache: Dict[Tuple[str, int], QPoint] = {}
+            self._visible = False
+            # Position per (corner, stacking index), indexed corner_id * 2 + index.
+            self._pos_table: List[Optional[Tuple[int, int]]] = [None] * 8
             self.current_screen_geometry = QRect()
+            self._window_rect = QRect()
+            self._prev_bounds: Dict[str, QRect] = {"rec": QRect(), "buf": QRect()}
+            self._full_window_painted = False
+            self._color_cache: Dict[Tuple[int, int], QColor] = {}
+            self._pen_cache: Dict[Tuple[int, int, int], QPen] = {}
+            self._sprite_cache: Dict[Tuple[str, bool], QPixmap] = {}
+            self._border_pen = QPen()
+            self._shape_brush = QBrush(Qt.SolidPattern)
+            self._pause_lines = (QLineF(), QLineF())
+            self._check_lines = (QLineF(), QLineF())
 
             self.rec_state = RecordingState()
             self.buf_state = BufferState()
             self.save_sound: Optional[QSoundEffect] = None
 
+            # Timers first: _init_ui -> _update_geometry wakes the animation
+            # timer as soon as a valid screen geometry is applied.
+            self._setup_timers()
             self._init_ui()
             self._setup_signals()
-            self._setup_timers()
             self._setup_sound()
 
         def _init_ui(self) -> None:
             self.setWindowTitle("OBS Status Overlay")
             self.setAttribute(Qt.WA_TranslucentBackground)
+            self.setAttribute(Qt.WA_NoSystemBackground)
             self.setAttribute(Qt.WA_ShowWithoutActivating)
             self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint | Qt.Tool)
             self._update_geometry()
             self._setup_win32_attributes()
 
         def _setup_win32_attributes(self) -> None:
-            if os.name != 'nt': return
+            if _user32 is None: return
             try:
                 hwnd = int(self.winId())
-                ctypes.windll.user32.SetWindowPos(hwnd, -1, 0, 0, 0, 0, 0x0001 | 0x0002)
-                ex_style = ctypes.windll.user32.GetWindowLongW(hwnd, -20)
-                ctypes.windll.user32.SetWindowLongW(hwnd, -20, ex_style | 0x00080000 | 0x00000020)
+                _user32.SetWindowPos(hwnd, -1, 0, 0, 0, 0, 0x0001 | 0x0002)
+                ex_style = _user32.GetWindowLongW(hwnd, -20)
+                _user32.SetWindowLongW(hwnd, -20, ex_style | 0x00080000 | 0x00000020)
             except Exception as e:
                 log.warning(f"Failed to set window attributes for click-through: {e}")
 
         def _setup_signals(self) -> None:
             self.emitter.rec_status_changed.connect(self.on_rec_status_changed, Qt.QueuedConnection)
             self.emitter.buf_status_changed.connect(self.on_buf_status_changed, Qt.QueuedConnection)
+            self.emitter.initial_state.connect(self.on_initial_state, Qt.QueuedConnection)
             self.emitter.settings_updated.connect(self.on_settings_updated, Qt.QueuedConnection)
 
+        def _frame_interval(self) -> int:
+            # Match the primary screen's refresh rate; a fixed 16 ms tick
+            # over-wakes on 30/50 Hz displays and under-serves 120 Hz ones.
+            screen = QGuiApplication.primaryScreen()
+            rate = screen.refreshRate() if screen else 0.0
+            if rate and rate > 0:
+                return max(1, round(1000.0 / rate))
+            return Animation.FRAME_INTERVAL_MS
+
         def _setup_timers(self) -> None:
+            self._last_tick = time.monotonic()
             self.animation_timer = QTimer(self)
+            self.animation_timer.setTimerType(Qt.PreciseTimer)
             self.animation_timer.timeout.connect(self.update_animations)
-            self.animation_timer.start(Animation.FRAME_INTERVAL_MS)
+            self.animation_timer.start(self._frame_interval())
 
-            self.geometry_timer = QTimer(self)
-            self.geometry_timer.timeout.connect(self._update_geometry)
-            self.geometry_timer.start(Timeouts.SCREEN_GEOMETRY_CHECK_MS)
+            # React to screen changes instead of polling the geometry.
+            self._tracked_screen = None
+            QGuiApplication.instance().primaryScreenChanged.connect(self._on_primary_screen_changed)
+            self._track_screen(QGuiApplication.primaryScreen())
 
         def _setup_sound(self) -> None:
             if not HAS_QTSOUND: return
             self.save_sound = QSoundEffect(self)
+            self._current_sound_path: Optional[str] = None
+            self._current_volume: Optional[float] = None
             self._update_sound()
 
         def _update_sound(self) -> None:
             if not self.save_sound: return
             path = self.settings.get("save_sound_path", "")
             volume = self.settings.get("save_sound_volume", 100) / 100.0
-            
+
             if path and not os.path.isabs(path):
                 try:
                     # obs.script_path() is the intended way, but __file__ is a reliable fallback
@@ -283,45 +519,149 @@ if HAS_PYSIDE:
                     # Fallback if both fail
                     pass
 
+            # Reloading the source hits the filesystem and restarts decoding;
+            # skip it when neither the resolved path nor the volume changed.
+            if path == self._current_sound_path and volume == self._current_volume:
+                return
+            self._current_sound_path = path
+            self._current_volume = volume
+
             if path and os.path.exists(path):
                 self.save_sound.setSource(QUrl.fromLocalFile(path))
                 self.save_sound.setVolume(volume)
             else:
                 self.save_sound.setSource(QUrl())
 
+        def _track_screen(self, screen) -> None:
+            if screen is self._tracked_screen:
+                return
+            if self._tracked_screen is not None:
+                self._tracked_screen.geometryChanged.disconnect(self._on_screen_geometry_changed)
+            self._tracked_screen = screen
+            if screen is not None:
+                screen.geometryChanged.connect(self._on_screen_geometry_changed)
+
+        def _on_primary_screen_changed(self, screen) -> None:
+            self._track_screen(screen)
+            self._update_geometry()
+
+        def _on_screen_geometry_changed(self, _geometry: QRect) -> None:
+            self._update_geometry()
+
         def closeEvent(self, event: QPaintEvent) -> None:
             self.closing = True
             self.animation_timer.stop()
-            self.geometry_timer.stop()
+            self._track_screen(None)
             self.deleteLater()
             super().closeEvent(event)
 
+        def on_initial_state(self, rec_active: bool, rec_paused: bool, buf_active: bool) -> None:
+            if self.closing: return
+            self.rec_state.active = rec_active
+            self.rec_state.paused = rec_paused
+            self.buf_state.active = buf_active
+            self._wake_animation()
+
         def on_rec_status_changed(self, active: bool, paused: bool) -> None:
             if self.closing: return
-            self.rec_state.active = active
-            self.rec_state.paused = paused
+            rec = self.rec_state
+            if rec.active == active and rec.paused == paused:
+                return
+            rec.active = active
+            rec.paused = paused
+            self._wake_animation()
 
         def on_buf_status_changed(self, active: bool, saved: bool) -> None:
             if self.closing: return
+            # Saves are pulses and always replay; plain state repeats are no-ops.
+            if not saved and self.buf_state.active == active:
+                return
             if saved:
                 self.buf_state.active = True
                 self.buf_state.saved = True
                 self.buf_state.saved_time = time.monotonic()
-                if self.settings["flash_on_save"]:
+                QTimer.singleShot(int(self._cfg.checkmark_duration * 1000) + 10,
+                                  self._expire_checkmark)
+                if self._cfg.flash_on_save:
                     self.buf_state.flash_start_time = time.monotonic()
                     self.buf_state.flash_effect.set_target(1.0)
                 if self.save_sound and self.save_sound.isLoaded():
                     self.save_sound.play()
             else:
                 self.buf_state.active = active
+            self._wake_animation()
+
+        def _expire_checkmark(self) -> None:
+            buf = self.buf_state
+            if self.closing or not buf.saved:
+                return
+            remaining = buf.saved_time + self._cfg.checkmark_duration - time.monotonic()
+            if remaining > 0:
+                # A newer save (or a longer duration) superseded this shot.
+                QTimer.singleShot(int(remaining * 1000) + 10, self._expire_checkmark)
+                return
+            buf.saved = False
+            buf.saved_time = 0.0
+            self._wake_animation()
+
+        def _overlay_enabled(self) -> bool:
+            return (self._cfg.corner_rec != Corner.OFF.value or
+                    self._cfg.corner_buf != Corner.OFF.value)
+
+        def _apply_visibility(self) -> None:
+            if self._overlay_enabled():
+                if not self._visible:
+                    self.show()
+                    self._wake_animation()
+            elif self._visible:
+                self.hide()
+
+        def showEvent(self, event: QShowEvent) -> None:
+            self._visible = True
+            super().showEvent(event)
+
+        def hideEvent(self, event: QHideEvent) -> None:
+            self._visible = False
+            super().hideEvent(event)
+
+        def _is_idle(self) -> bool:
+            rec, buf = self.rec_state, self.buf_state
+            for value in (rec.visibility, rec.pause_icon, rec.border_width,
+                          buf.visibility, buf.checkmark_icon, buf.dim_effect,
+                          buf.flash_effect, buf.border_width, buf.save_border_width):
+                if value.current != value.target:
+                    return False
+            if (rec.pos_x != rec.tgt_x or rec.pos_y != rec.tgt_y or
+                    buf.pos_x != buf.tgt_x or buf.pos_y != buf.tgt_y):
+                return False
+            return buf.flash_start_time == 0.0
+
+        def _wake_animation(self) -> None:
+            if not self.closing and not self.animation_timer.isActive():
+                self._last_tick = time.monotonic()
+                self.animation_timer.start(self._frame_interval())
 
-        def on_settings_updated(self, new_settings: Dict[str, Any]) -> None:
+        def on_settings_updated(self, changed_settings: Dict[str, Any]) -> None:
             if self.closing: return
-            self.settings = new_settings
-            self.positions_cache.clear()
-            self._update_geometry()
-            self._update_sound()
-            self.update()
+            self.settings.update(changed_settings)
+            self._cfg = OverlayConfig.from_settings(self.settings)
+
+            changed = changed_settings.keys()
+            visual = not _VISUAL_SETTING_KEYS.isdisjoint(changed)
+            layout = not _LAYOUT_SETTING_KEYS.isdisjoint(changed)
+            if visual:
+                self._color_cache.clear()
+                self._pen_cache.clear()
+                self._sprite_cache.clear()
+            if layout:
+                self._rebuild_positions()
+            if not _SOUND_SETTING_KEYS.isdisjoint(changed):
+                self._update_sound()
+            if "corner_rec" in changed or "corner_buf" in changed:
+                self._apply_visibility()
+            self._wake_animation()
+            if visual or layout:
+                self.update()
 
         def _update_geometry(self) -> None:
             if self.closing: return
@@ -333,148 +673,239 @@ if HAS_PYSIDE:
             if (screen_geometry := screen.geometry()) != self.current_screen_geometry:
                 self.setGeometry(screen_geometry)
                 self.current_screen_geometry = screen_geometry
-                self.positions_cache.clear()
+                self._window_rect = QRect(0, 0, screen_geometry.width(), screen_geometry.height())
+                self._rebuild_positions()
+                self._wake_animation()
                 self.update()
 
-        def _calculate_position(self, corner: str, index: int = 0) -> Optional[QPoint]:
-            if not self.current_screen_geometry.isValid() or corner == Corner.OFF.value:
+        def _rebuild_positions(self) -> None:
+            table: List[Optional[Tuple[int, int]]] = [None] * 8
+            if self.current_screen_geometry.isValid():
+                cfg = self._cfg
+                margin = cfg.margin
+                radius = cfg.bg_size // 2
+                width, height = self.width(), self.height()
+                for index in (0, 1):
+                    offset = index * (cfg.bg_size + margin)
+                    table[index] = (margin + radius + offset, margin + radius)
+                    table[2 + index] = (width - margin - radius - offset, margin + radius)
+                    table[4 + index] = (margin + radius + offset, height - margin - radius)
+                    table[6 + index] = (width - margin - radius - offset, height - margin - radius)
+            self._pos_table = table
+
+        def _calculate_position(self, corner: str, index: int = 0) -> Optional[Tuple[int, int]]:
+            corner_id = _CORNER_ID.get(corner, _CORNER_OFF_ID)
+            if corner_id >= _CORNER_OFF_ID:
                 return None
-
-            cache_key = (corner, index)
-            if cache_key in self.positions_cache:
-                return self.positions_cache[cache_key]
-
-            size = self.settings["size"]
-            margin = self.settings["margin"]
-            bg_size = int(size * self.settings["bg_size_percent"] / 100)
-            radius = bg_size // 2
-            offset = index * (bg_size + margin)
-            width, height = self.width(), self.height()
-
-            pos_map = {
-                Corner.TOP_LEFT.value: QPoint(margin + radius + offset, margin + radius),
-                Corner.TOP_RIGHT.value: QPoint(width - margin - radius - offset, margin + radius),
-                Corner.BOTTOM_LEFT.value: QPoint(margin + radius + offset, height - margin - radius),
-                Corner.BOTTOM_RIGHT.value: QPoint(width - margin - radius - offset, height - margin - radius)
-            }
-            if pos := pos_map.get(corner):
-                self.positions_cache[cache_key] = pos
-            return pos
+            return self._pos_table[corner_id * 2 + index]
 
         def update_animations(self) -> None:
             if self.closing: return
+            if not self._visible:
+                self.animation_timer.stop()
+                return
 
-            # Update targets
-            self.rec_state.visibility.set_target(self.rec_state.active)
-            self.rec_state.pause_icon.set_target(self.rec_state.paused)
+            cfg = self._cfg
+            rec = self.rec_state
+            buf = self.buf_state
+            now = time.monotonic()
+            dt = min(now - self._last_tick, Animation.MAX_FRAME_TIME)
+            self._last_tick = now
+            speed = 1.0 - math.exp(-Animation.SPEED_RATE * dt)
+
+            # Belt-and-braces early-out: nothing active, nothing visible on screen.
+            # Snap whatever is left mid-flight (it cannot be seen) so the timer
+            # can stop instead of ticking against stale targets.
+            if (not rec.active and not buf.active and
+                    rec.visibility.current == 0.0 and buf.visibility.current == 0.0 and
+                    buf.flash_effect.current == 0.0 and rec.border_width.current == 0.0 and
+                    buf.border_width.current == 0.0 and buf.save_border_width.current == 0.0):
+                # Snap to state-derived resting values, not the recorded
+                # targets: those can be stale if the state changed (e.g. the
+                # checkmark expired) since the last tick refreshed them.
+                rec.pause_icon.set_target(rec.paused, immediate=True)
+                buf.checkmark_icon.set_target(buf.saved, immediate=True)
+                buf.dim_effect.set_target(1.0, immediate=True)
+                rec.pos_x, rec.pos_y = rec.tgt_x, rec.tgt_y
+                buf.pos_x, buf.pos_y = buf.tgt_x, buf.tgt_y
+                buf.flash_start_time = 0.0
+                if self._is_idle():
+                    self.animation_timer.stop()
+                return
 
-            if self.buf_state.saved and time.monotonic() - self.buf_state.saved_time > self.settings["checkmark_duration"]:
-                self.buf_state.saved = False
-                self.buf_state.saved_time = 0.0
+            # Update targets
+            rec.visibility.set_target(rec.active)
+            rec.pause_icon.set_target(rec.paused)
 
-            self.buf_state.visibility.set_target(self.buf_state.active)
-            self.buf_state.checkmark_icon.set_target(self.buf_state.saved)
+            buf.visibility.set_target(buf.active)
+            buf.checkmark_icon.set_target(buf.saved)
 
-            dim_target = Draw.DIM_OPACITY if self.rec_state.active and self.rec_state.paused else 1.0
-            self.buf_state.dim_effect.set_target(dim_target)
+            dim_target = Draw.DIM_OPACITY if rec.active and rec.paused else 1.0
+            buf.dim_effect.set_target(dim_target)
 
-            if self.buf_state.flash_start_time > 0:
-                if time.monotonic() - self.buf_state.flash_start_time > self.settings["flash_duration"]:
-                    self.buf_state.flash_effect.set_target(0.0)
-                    if self.buf_state.flash_effect.current < Animation.SNAP_THRESHOLD:
-                        self.buf_state.flash_start_time = 0.0
+            if buf.flash_start_time > 0:
+                if now - buf.flash_start_time > cfg.flash_duration:
+                    buf.flash_effect.set_target(0.0)
+                    if buf.flash_effect.current < Animation.SNAP_THRESHOLD:
+                        buf.flash_start_time = 0.0
 
             # Border logic
-            rec_border_on = self.settings["rec_border_enabled"] and self.rec_state.active
-            buf_border_on = self.settings["buf_border_enabled"] and self.buf_state.active
+            rec_border_on = cfg.rec_border_enabled and rec.active
+            buf_border_on = cfg.buf_border_enabled and buf.active
 
-            pause_border_on = (not self.settings["rec_border_enabled"] and
-                               self.settings["rec_pause_border_enabled"] and
-                               self.rec_state.active and self.rec_state.paused)
+            pause_border_on = (not cfg.rec_border_enabled and
+                               cfg.rec_pause_border_enabled and
+                               rec.active and rec.paused)
 
-            save_border_on = (not self.settings["buf_border_enabled"] and
-                              self.settings["buf_save_border_enabled"] and
-                              self.buf_state.saved)
+            save_border_on = (not cfg.buf_border_enabled and
+                              cfg.buf_save_border_enabled and
+                              buf.saved)
 
-            target_rec_border_width = self.settings["border_width"] if rec_border_on or pause_border_on else 0
-            self.rec_state.border_width.set_target(target_rec_border_width)
-
-            self.buf_state.border_width.set_target(self.settings["border_width"] if buf_border_on else 0)
-            self.buf_state.save_border_width.set_target(self.settings["border_width"] if save_border_on else 0)
+            target_rec_border_width = cfg.border_width if rec_border_on or pause_border_on else 0
+            rec.border_width.set_target(target_rec_border_width)
 
+            buf.border_width.set_target(cfg.border_width if buf_border_on else 0)
+            buf.save_border_width.set_target(cfg.border_width if save_border_on else 0)
 
             # Update positions
-            self._update_indicator_position(self.rec_state)
-            self._update_indicator_position(self.buf_state)
+            self._update_indicator_position(rec)
+            self._update_indicator_position(buf)
 
-            # Update animated values
+            # Update animated values. A fully faded indicator cannot be seen
+            # sliding, so snap its position instead of lerping it for frames.
+            fade = cfg.fade_effect
             updated = False
-            for state in [self.rec_state, self.buf_state]:
-                updated |= state.visibility.update(Animation.SPEED, self.settings["fade_effect"])
-                updated |= self._update_position_animation(state)
-
-            updated |= self.rec_state.pause_icon.update(Animation.SPEED, self.settings["animate_pause"])
-            updated |= self.buf_state.checkmark_icon.update(Animation.SPEED, self.settings["animate_checkmark"])
-            updated |= self.buf_state.dim_effect.update(Animation.SPEED, self.settings["fade_effect"])
-            flash_speed_multiplier = 4.0 if self.buf_state.flash_effect.target == 1.0 else 1.0
-            updated |= self.buf_state.flash_effect.update(Animation.SPEED * flash_speed_multiplier, True)
-            updated |= self.rec_state.border_width.update(Animation.SPEED, True)
-            updated |= self.buf_state.border_width.update(Animation.SPEED, True)
-            updated |= self.buf_state.save_border_width.update(Animation.SPEED, True)
+            for state in (rec, buf):
+                if state.visibility.current < Animation.SNAP_THRESHOLD:
+                    state.pos_x, state.pos_y = state.tgt_x, state.tgt_y
+                else:
+                    updated |= self._update_position_animation(state, speed)
+
+            for value, enabled in ((rec.visibility, fade),
+                                   (buf.visibility, fade),
+                                   (rec.pause_icon, cfg.animate_pause),
+                                   (buf.checkmark_icon, cfg.animate_checkmark),
+                                   (buf.dim_effect, fade),
+                                   (rec.border_width, True),
+                                   (buf.border_width, True),
+                                   (buf.save_border_width, True)):
+                updated |= value.update(speed, enabled)
+
+            # Flash ramps up four times faster; compound the per-frame alpha so
+            # the boost stays frame-rate independent too.
+            flash_speed = 1.0 - (1.0 - speed) ** 4 if buf.flash_effect.target == 1.0 else speed
+            updated |= buf.flash_effect.update(flash_speed, True)
 
             if updated:
-                self.update()
+                self.update(self._dirty_rect())
+            elif self._is_idle():
+                self.animation_timer.stop()
+
+        def _cached_color(self, rgb: int, alpha: int) -> QColor:
+            key = (rgb, alpha)
+            color = self._color_cache.get(key)
+            if color is None:
+                color = QColor(rgb)
+                color.setAlpha(alpha)
+                self._color_cache[key] = color
+            return color
+
+        def _cached_pen(self, rgb: int, alpha: int, width: int) -> QPen:
+            key = (rgb, alpha, width)
+            pen = self._pen_cache.get(key)
+            if pen is None:
+                pen = QPen(self._cached_color(rgb, alpha), width, cap=Qt.RoundCap, join=Qt.RoundJoin)
+                self._pen_cache[key] = pen
+            return pen
+
+        def _indicator_bounds(self, state: IndicatorState) -> QRect:
+            cfg = self._cfg
+            half = max(cfg.bg_size, cfg.size) // 2 + 2
+            x, y = round(state.pos_x), round(state.pos_y)
+            return QRect(x - half, y - half, half * 2, half * 2)
+
+        def _dirty_rect(self) -> QRect:
+            # Borders and the flash effect cover the whole window, so fall back
+            # to a full repaint while any of them is in play.
+            full_repaint = (self.buf_state.flash_effect.current > Animation.SNAP_THRESHOLD or
+                            self.rec_state.border_width.current > Animation.SNAP_THRESHOLD or
+                            self.buf_state.border_width.current > Animation.SNAP_THRESHOLD or
+                            self.buf_state.save_border_width.current > Animation.SNAP_THRESHOLD)
+            # One extra full invalidation on the frame an effect crosses below
+            # the threshold, or its last painted fill lingers on screen.
+            needs_full = full_repaint or self._full_window_painted
+            self._full_window_painted = full_repaint
+            dirty = QRect()
+            for state in (self.rec_state, self.buf_state):
+                bounds = self._indicator_bounds(state)
+                dirty = dirty.united(bounds).united(self._prev_bounds[state.name])
+                self._prev_bounds[state.name] = bounds
+            return self._window_rect if needs_full else dirty
 
         def _update_indicator_position(self, state: IndicatorState) -> None:
-            corner_setting = self.settings[f"corner_{state.name}"]
+            cfg = self._cfg
+            corner_setting = cfg.corner_rec if state.name == "rec" else cfg.corner_buf
             if corner_setting == Corner.OFF.value:
-                state.target_position = QPointF()
+                state.tgt_x = state.tgt_y = 0.0
+                state.has_target = False
                 return
 
             is_rec_active_on_same_corner = (
                     self.rec_state.active and
-                    self.settings["corner_rec"] == self.settings["corner_buf"] and
-                    self.settings["corner_rec"] != Corner.OFF.value
+                    cfg.corner_rec == cfg.corner_buf and
+                    cfg.corner_rec != Corner.OFF.value
             )
             index = 1 if state.name == "buf" and is_rec_active_on_same_corner else 0
 
-            if target_pos_qpoint := self._calculate_position(corner_setting, index):
-                target_pos = QPointF(target_pos_qpoint)
-                if state.target_position != target_pos:
-                    state.target_position = target_pos
-                    if state.position.isNull():
-                        state.position = target_pos
-
-        def _update_position_animation(self, state: IndicatorState) -> bool:
-            if state.position == state.target_position:
+            if target_pos := self._calculate_position(corner_setting, index):
+                tx, ty = target_pos
+                state.has_target = True
+                if state.tgt_x != tx or state.tgt_y != ty:
+                    state.tgt_x, state.tgt_y = tx, ty
+                    if state.pos_x == 0.0 and state.pos_y == 0.0:
+                        state.pos_x, state.pos_y = tx, ty
+
+        def _update_position_animation(self, state: IndicatorState, speed: float) -> bool:
+            tx, ty = state.tgt_x, state.tgt_y
+            if state.pos_x == tx and state.pos_y == ty:
                 return False
 
-            if not self.settings["smooth_position"] or state.target_position.isNull():
-                state.position = state.target_position
+            if not self._cfg.smooth_position or not state.has_target:
+                state.pos_x, state.pos_y = tx, ty
                 return True
 
-            new_x = lerp(state.position.x(), state.target_position.x(), Animation.SPEED)
-            new_y = lerp(state.position.y(), state.target_position.y(), Animation.SPEED)
+            new_x = lerp(state.pos_x, tx, speed)
+            new_y = lerp(state.pos_y, ty, speed)
 
-            if (abs(new_x - state.target_position.x()) < Animation.POSITION_SNAP_THRESHOLD and
-                    abs(new_y - state.target_position.y()) < Animation.POSITION_SNAP_THRESHOLD):
-                new_pos = state.target_position
-            else:
-                new_pos = QPointF(new_x, new_y)
+            if (abs(new_x - tx) < Animation.POSITION_SNAP_THRESHOLD and
+                    abs(new_y - ty) < Animation.POSITION_SNAP_THRESHOLD):
+                new_x, new_y = tx, ty
 
-            if new_pos != state.position:
-                state.position = new_pos
+            if new_x != state.pos_x or new_y != state.pos_y:
+                state.pos_x, state.pos_y = new_x, new_y
                 return True
             return False
 
         def paintEvent(self, event: QPaintEvent) -> None:
             if self.closing: return
+            rec, buf = self.rec_state, self.buf_state
+            # Fully faded out: nothing would be drawn, so skip the QPainter
+            # setup entirely (begin/end on a translucent window is not free).
+            snap = Animation.SNAP_THRESHOLD
+            if (rec.visibility.current < snap and buf.visibility.current < snap and
+                    buf.flash_effect.current < snap and rec.border_width.current <= snap and
+                    buf.border_width.current <= snap and buf.save_border_width.current <= snap):
+                return
             painter = QPainter(self)
             painter.setRenderHint(QPainter.Antialiasing)
+            painter.setClipRegion(event.region())
+            exposed = event.rect()
             self._paint_borders(painter)
             self._paint_flash(painter)
-            self._paint_indicator(painter, self.rec_state)
-            self._paint_indicator(painter, self.buf_state)
+            if exposed.intersects(self._indicator_bounds(self.rec_state)):
+                self._paint_indicator(painter, self.rec_state)
+            if exposed.intersects(self._indicator_bounds(self.buf_state)):
+                self._paint_indicator(painter, self.buf_state)
 
         def _paint_flash(self, painter: QPainter) -> None:
             if self.buf_state.flash_effect.current < Animation.SNAP_THRESHOLD:
@@ -482,181 +913,192 @@ if HAS_PYSIDE:
             alpha = self.buf_state.flash_effect.current
             if self.buf_state.flash_effect.target == 0.0:
                 alpha = ease_out_cubic(alpha)
-            color = QColor(self.settings["flash_color"])
-            color.setAlphaF(alpha)
-            painter.fillRect(self.rect(), color)
+            color = self._cached_color(self._cfg.flash_color, max(0, min(int(255 * alpha), 255)))
+            painter.fillRect(self._window_rect, color)
 
         def _paint_borders(self, painter: QPainter) -> None:
             painter.save()
             # Regular recording border
             if self.rec_state.border_width.current > Animation.SNAP_THRESHOLD:
                 width = self.rec_state.border_width.current
-                color_key = "rec_pause_border_color" if self.rec_state.paused else "rec_border_color"
-                color = QColor(self.settings[color_key])
+                rgb = (self._cfg.rec_pause_border_color if self.rec_state.paused
+                       else self._cfg.rec_border_color)
+                color = self._cached_color(rgb, 255)
                 self._draw_border(painter, width, color)
 
             # Regular buffer border
             if self.buf_state.border_width.current > Animation.SNAP_THRESHOLD:
                 width = self.buf_state.border_width.current
-                color_key = "buf_save_border_color" if self.buf_state.saved else "buf_border_color"
-                color = QColor(self.settings[color_key])
+                rgb = (self._cfg.buf_save_border_color if self.buf_state.saved
+                       else self._cfg.buf_border_color)
+                color = self._cached_color(rgb, 255)
                 self._draw_border(painter, width, color)
 
             # Special save border
             if self.buf_state.save_border_width.current > Animation.SNAP_THRESHOLD:
                 width = self.buf_state.save_border_width.current
-                color = QColor(self.settings["buf_save_border_color"])
+                color = self._cached_color(self._cfg.buf_save_border_color, 255)
                 self._draw_border(painter, width, color)
             painter.restore()
 
         def _draw_border(self, painter: QPainter, width: float, color: QColor) -> None:
             if width < 1 or color.alphaF() == 0.0:
                 return
-            pen = QPen(color)
+            pen = self._border_pen
+            pen.setColor(color)
             pen.setWidthF(width)
             painter.setPen(pen)
             painter.setBrush(Qt.NoBrush)
             inset = width / 2
-            rect = self.rect().adjusted(inset, inset, -inset, -inset)
+            rect = self._window_rect.adjusted(inset, inset, -inset, -inset)
             painter.drawRect(rect)
 
+        def _steady_sprite(self, state: IndicatorState, icon_on: bool) -> QPixmap:
+            """Pre-rendered background + glyph for the settled (non-animating) state."""
+            key = (state.name, icon_on)
+            sprite = self._sprite_cache.get(key)
+            if sprite is None:
+                cfg = self._cfg
+                side = max(cfg.bg_size, cfg.size) + 4
+                sprite = QPixmap(side, side)
+                sprite.fill(Qt.transparent)
+                sprite_painter = QPainter(sprite)
+                sprite_painter.setRenderHint(QPainter.Antialiasing)
+                center = side // 2
+                self._draw_background(sprite_painter, center, center, 1.0)
+                state.paint(self, sprite_painter, center, center, 1.0, 1.0)
+                sprite_painter.end()
+                self._sprite_cache[key] = sprite
+            return sprite
+
         def _paint_indicator(self, painter: QPainter, state: IndicatorState) -> None:
             if state.visibility.current < Animation.SNAP_THRESHOLD:
                 return
 
-            pos = state.position.toPoint()
+            x, y = round(state.pos_x), round(state.pos_y)
             master_anim = state.visibility.current
 
-            dim_factor = state.dim_effect.current if isinstance(state, BufferState) else 1.0
-            self._draw_background(painter, pos, master_anim * dim_factor)
+            dim_factor = state.dim_factor()
 
-            if isinstance(state, RecordingState):
-                pause_progress = state.pause_icon.current
-                main_opacity = 1.0 - pause_progress
-
-                if pause_progress > Animation.SNAP_THRESHOLD:
-                    self._draw_pause_icon(painter, pos, pause_progress, master_anim, self.settings["rec_pause_color"])
-                if main_opacity > Animation.SNAP_THRESHOLD:
-                    self._draw_indicator(painter, pos, master_anim, self.settings["rec_color"], main_opacity)
-
-            elif isinstance(state, BufferState):
-                checkmark_progress = state.checkmark_icon.current
-                main_opacity = 1.0 - checkmark_progress
+            # Settled state: blit the cached sprite instead of re-rasterizing.
+            icon_progress = state.icon_progress()
+            if master_anim == 1.0 and dim_factor == 1.0 and icon_progress in (0.0, 1.0):
+                sprite = self._steady_sprite(state, icon_progress == 1.0)
+                painter.drawPixmap(x - sprite.width() // 2, y - sprite.height() // 2, sprite)
+                return
 
-                if main_opacity > Animation.SNAP_THRESHOLD:
-                    self._draw_indicator(painter, pos, master_anim, self.settings["buf_color"],
-                                         main_opacity * dim_factor)
-                if checkmark_progress > Animation.SNAP_THRESHOLD:
-                    self._draw_checkmark(painter, pos, checkmark_progress, master_anim,
-                                         self.settings["buf_saved_color"], dim_factor)
+            self._draw_background(painter, x, y, master_anim * dim_factor)
+            state.paint(self, painter, x, y, master_anim, dim_factor)
 
-        def _draw_shape(self, painter: QPainter, rect: QRect, shape: str, color: QColor, rounded_ratio: float) -> None:
+        def _draw_shape(self, painter: QPainter, rect: QRect, shape: int, color: QColor, rounded_ratio: float) -> None:
             if color.alpha() < 1: return
-            painter.setBrush(QBrush(color))
+            brush = self._shape_brush
+            brush.setColor(color)
+            painter.setBrush(brush)
             painter.setPen(Qt.NoPen)
 
-            if shape == Shape.CIRCLE.value:
+            if shape == _SHAPE_CIRCLE_ID:
                 painter.drawEllipse(rect)
-            elif shape == Shape.SQUARE.value:
+            elif shape == _SHAPE_SQUARE_ID:
                 painter.drawRect(rect)
             else:
                 radius = min(rect.width(), rect.height()) * rounded_ratio
                 painter.drawRoundedRect(rect, radius, radius)
 
-        def _draw_background(self, painter: QPainter, pos: QPoint, anim_value: float) -> None:
-            bg_size = int(self.settings["size"] * self.settings["bg_size_percent"] / 100)
+        def _draw_background(self, painter: QPainter, x: int, y: int, anim_value: float) -> None:
+            cfg = self._cfg
+            bg_size = cfg.bg_size
             if bg_size <= 0: return
 
-            bg_alpha = self.settings["bg_opacity"] / 100.0
-            alpha = int(255 * anim_value * bg_alpha)
-            color = QColor(0, 0, 0, max(0, min(alpha, 255)))
-            rect = QRect(pos.x() - bg_size // 2, pos.y() - bg_size // 2, bg_size, bg_size)
-            self._draw_shape(painter, rect, self.settings["bg_shape"], color, Draw.BG_ROUNDED_RECT_RADIUS_RATIO)
+            alpha = min(int(255 * anim_value * cfg.bg_opacity), 255)
+            if alpha < 1: return
+
+            color = self._cached_color(0x000000, alpha)
+            rect = QRect(x - bg_size // 2, y - bg_size // 2, bg_size, bg_size)
+            self._draw_shape(painter, rect, cfg.bg_shape, color, Draw.BG_ROUNDED_RECT_RADIUS_RATIO)
 
-        def _draw_indicator(self, painter: QPainter, pos: QPoint, master_anim: float, rgb_color: int,
+        def _draw_indicator(self, painter: QPainter, x: int, y: int, master_anim: float, rgb_color: int,
                             opacity_multiplier: float) -> None:
-            size = self.settings["size"]
+            cfg = self._cfg
+            size = cfg.size
             if size <= 0: return
 
-            base_alpha = master_anim * (self.settings["opacity"] / 100.0)
-            final_alpha = int(255 * base_alpha * opacity_multiplier)
-            color = QColor(rgb_color)
-            color.setAlpha(max(0, min(final_alpha, 255)))
-            rect = QRect(pos.x() - size // 2, pos.y() - size // 2, size, size)
-            self._draw_shape(painter, rect, self.settings["indicator_shape"], color,
+            final_alpha = min(int(255 * master_anim * cfg.opacity * opacity_multiplier), 255)
+            if final_alpha < 1: return
+
+            color = self._cached_color(rgb_color, final_alpha)
+            rect = QRect(x - size // 2, y - size // 2, size, size)
+            self._draw_shape(painter, rect, cfg.indicator_shape, color,
                              Draw.INDICATOR_ROUNDED_RECT_RADIUS_RATIO)
 
-        def _draw_pause_icon(self, painter: QPainter, pos: QPoint, icon_progress: float, master_anim: float,
+        def _draw_pause_icon(self, painter: QPainter, x: int, y: int, icon_progress: float, master_anim: float,
                              rgb_color: int) -> None:
-            size = self.settings["size"]
+            cfg = self._cfg
+            size = cfg.size
             if size <= 0: return
 
+            final_alpha = min(int(255 * master_anim * cfg.opacity * icon_progress), 255)
+            if final_alpha < 1: return
+
             eased_progress = ease_in_out_cubic(icon_progress)
-            base_alpha = master_anim * (self.settings["opacity"] / 100.0)
-            final_alpha = int(255 * base_alpha * icon_progress)
-            color = QColor(rgb_color)
-            color.setAlpha(max(0, min(final_alpha, 255)))
-            if color.alpha() < 1: return
 
             pen_width = max(2, int(size * Draw.PAUSE_PEN_WIDTH_RATIO))
             bar_height = size * Draw.PAUSE_BAR_HEIGHT_RATIO
             bar_spacing = size * Draw.PAUSE_BAR_SPACING_RATIO * eased_progress
 
-            pen = QPen(color, pen_width, cap=Qt.RoundCap)
-            painter.setPen(pen)
+            painter.setPen(self._cached_pen(rgb_color, final_alpha, pen_width))
             painter.setBrush(Qt.NoBrush)
 
-            center_x, center_y = pos.x(), pos.y()
+            center_x, center_y = x, y
             left_x, right_x = center_x - bar_spacing / 2, center_x + bar_spacing / 2
             animated_half_height = (bar_height * eased_progress) / 2
 
-            path = QPainterPath()
-            path.moveTo(left_x, center_y - animated_half_height)
-            path.lineTo(left_x, center_y + animated_half_height)
-            path.moveTo(right_x, center_y - animated_half_height)
-            path.lineTo(right_x, center_y + animated_half_height)
-            painter.drawPath(path)
+            top_y, bottom_y = center_y - animated_half_height, center_y + animated_half_height
+            left_line, right_line = self._pause_lines
+            left_line.setLine(left_x, top_y, left_x, bottom_y)
+            right_line.setLine(right_x, top_y, right_x, bottom_y)
+            painter.drawLine(left_line)
+            painter.drawLine(right_line)
 
-        def _draw_checkmark(self, painter: QPainter, pos: QPoint, icon_progress: float, master_anim: float,
+        def _draw_checkmark(self, painter: QPainter, x: int, y: int, icon_progress: float, master_anim: float,
                             rgb_color: int, dim_factor: float) -> None:
-            size = self.settings["size"]
+            cfg = self._cfg
             eased_progress = ease_in_out_cubic(icon_progress)
             is_appearing = self.buf_state.checkmark_icon.target == 1.0
 
-            base_alpha = master_anim * (self.settings["opacity"] / 100.0)
-            final_alpha = int(255 * base_alpha * dim_factor * eased_progress)
-            color = QColor(rgb_color)
-            color.setAlpha(max(0, min(final_alpha, 255)))
-            if color.alpha() < 1: return
+            base_alpha = master_anim * cfg.opacity
+            final_alpha = max(0, min(int(255 * base_alpha * dim_factor * eased_progress), 255))
+            if final_alpha < 1: return
 
             painter.save()
-            pen_width = max(2, int(size * Draw.CHECKMARK_PEN_WIDTH_RATIO))
-            pen = QPen(color, pen_width, cap=Qt.RoundCap, join=Qt.RoundJoin)
-            painter.setPen(pen)
+            painter.setPen(self._cached_pen(rgb_color, final_alpha, cfg.check_pen_width))
             painter.setBrush(Qt.NoBrush)
-            painter.translate(pos)
+            painter.translate(x, y)
 
             pop_scale = 1.0 + math.sin(eased_progress * math.pi) * 0.1
             painter.scale(pop_scale, pop_scale)
 
-            p1, p2, p3 = (p * size for p in (Draw.CHECKMARK_P1, Draw.CHECKMARK_P2, Draw.CHECKMARK_P3))
-            path = QPainterPath()
-            path.moveTo(p1)
+            x1, y1, x2, y2, x3, y3, d12x, d12y, d23x, d23y = cfg.check_coords
+            seg1, seg2 = self._check_lines
 
             if is_appearing:
                 split = Draw.CHECKMARK_ANIM_SPLIT
                 if eased_progress < split:
                     t = eased_progress / split
-                    path.lineTo(p1 + t * (p2 - p1))
+                    seg1.setLine(x1, y1, x1 + t * d12x, y1 + t * d12y)
+                    painter.drawLine(seg1)
                 else:
-                    path.lineTo(p2)
                     t = (eased_progress - split) / (1.0 - split)
-                    path.lineTo(p2 + t * (p3 - p2))
+                    seg1.setLine(x1, y1, x2, y2)
+                    seg2.setLine(x2, y2, x2 + t * d23x, y2 + t * d23y)
+                    painter.drawLine(seg1)
+                    painter.drawLine(seg2)
             else:
-                path.lineTo(p2)
-                path.lineTo(p3)
+                seg1.setLine(x1, y1, x2, y2)
+                seg2.setLine(x2, y2, x3, y3)
+                painter.drawLine(seg1)
+                painter.drawLine(seg2)
 
-            painter.drawPath(path)
             painter.restore()
 
 
@@ -666,33 +1108,63 @@ if HAS_PYSIDE:
             self.overlay: Optional[OverlayWindow] = None
             self.emitter = SignalEmitter()
             self.initial_settings = initial_settings
+            self.gui_ready = threading.Event()
 
         def run(self) -> None:
             self.app = QApplication.instance() or QApplication([])
             self.app.setQuitOnLastWindowClosed(True)
             self.overlay = OverlayWindow(self.emitter, self.initial_settings)
-            self.overlay.show()
+            self.overlay._apply_visibility()
+            # Slots are connected during OverlayWindow construction; queued
+            # emits from the OBS thread are safe from this point on.
+            self.gui_ready.set()
             self.app.exec_()
 
         def stop(self) -> None:
             if self.overlay:
                 QMetaObject.invokeMethod(self.overlay, "close", Qt.QueuedConnection)
+            if self.app:
+                QMetaObject.invokeMethod(self.app, "quit", Qt.QueuedConnection)
+
+
+_event_table: Optional[List[Optional[Tuple[Any, bool, bool, str, bool]]]] = None
+_last_emitted: Dict[str, Tuple[bool, bool]] = {}
+
+
+def _build_event_table() -> List[Optional[Tuple[Any, bool, bool, str, bool]]]:
+    # OBS frontend event ids are small non-negative ints, so a flat list
+    # indexed by event id beats hashing into a dict on every event.
+    # Entries are (bound emit, active, extra, dedupe key, is_pulse); pulse
+    # events must re-fire even when the payload repeats (each save replays
+    # the checkmark), everything else is idempotent state.
+    rec_emit = overlay_app.emitter.rec_status_changed.emit
+    buf_emit = overlay_app.emitter.buf_status_changed.emit
+    entries = {
+        obs.OBS_FRONTEND_EVENT_RECORDING_STARTING: (rec_emit, True, False, "rec", False),
+        obs.OBS_FRONTEND_EVENT_RECORDING_STOPPED: (rec_emit, False, False, "rec", False),
+        obs.OBS_FRONTEND_EVENT_RECORDING_PAUSED: (rec_emit, True, True, "rec", False),
+        obs.OBS_FRONTEND_EVENT_RECORDING_UNPAUSED: (rec_emit, True, False, "rec", False),
+        obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STARTED: (buf_emit, True, False, "buf", False),
+        obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STOPPED: (buf_emit, False, False, "buf", False),
+        obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_SAVED: (buf_emit, True, True, "buf", True),
+    }
+    table: List[Optional[Tuple[Any, bool, bool, str, bool]]] = [None] * (max(entries) + 1)
+    for event_id, entry in entries.items():
+        table[event_id] = entry
+    return table
 
 
 def event_handler(event: int) -> None:
-    if not HAS_PYSIDE or not overlay_app or not overlay_app.emitter: return
-
-    event_map = {
-        obs.OBS_FRONTEND_EVENT_RECORDING_STARTING: lambda: overlay_app.emitter.rec_status_changed.emit(True, False),
-        obs.OBS_FRONTEND_EVENT_RECORDING_STOPPED: lambda: overlay_app.emitter.rec_status_changed.emit(False, False),
-        obs.OBS_FRONTEND_EVENT_RECORDING_PAUSED: lambda: overlay_app.emitter.rec_status_changed.emit(True, True),
-        obs.OBS_FRONTEND_EVENT_RECORDING_UNPAUSED: lambda: overlay_app.emitter.rec_status_changed.emit(True, False),
-        obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STARTED: lambda: overlay_app.emitter.buf_status_changed.emit(True, False),
-        obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_STOPPED: lambda: overlay_app.emitter.buf_status_changed.emit(False, False),
-        obs.OBS_FRONTEND_EVENT_REPLAY_BUFFER_SAVED: lambda: overlay_app.emitter.buf_status_changed.emit(True, True),
-    }
-    if action := event_map.get(event):
-        action()
+    table = _event_table
+    if table is None or not 0 <= event < len(table):
+        return
+    if entry := table[event]:
+        emit, active, extra, key, pulse = entry
+        payload = (active, extra)
+        if not pulse and _last_emitted.get(key) == payload:
+            return
+        _last_emitted[key] = payload
+        emit(active, extra)
 
 
 def script_description() -> str:
@@ -704,136 +1176,221 @@ def _add_list_options(prop_list: Any, options: List[Tuple[str, str]]) -> None:
         obs.obs_property_list_add_string(prop_list, label, value)
 
 
-def script_properties() -> Any:
-    props = obs.obs_properties_create()
+_property_specs: Optional[List[Tuple[Any, ...]]] = None
+
+
+def _build_property_specs() -> List[Tuple[Any, ...]]:
+    """Flat, ordered schema for the settings dialog, resolved once.
+
+    OBS takes ownership of the props object returned by script_properties and
+    frees it when the dialog closes, so the object itself cannot be cached --
+    but the schema is static, so all STRINGS lookups, bound add_* functions
+    and argument tuples are. Re-opening the dialog then only replays the C
+    API calls.
+    """
+    S = STRINGS
+    list_args = (obs.OBS_COMBO_TYPE_LIST, obs.OBS_COMBO_FORMAT_STRING)
+    add_int = obs.obs_properties_add_int
+    add_int_slider = obs.obs_properties_add_int_slider
+    add_float_slider = obs.obs_properties_add_float_slider
+    add_bool = obs.obs_properties_add_bool
+    add_color = obs.obs_properties_add_color
+    add_list = obs.obs_properties_add_list
+    add_path = obs.obs_properties_add_path
+    return [
+        ("group", None, "appearance", "Appearance"),
+        ("widget", "appearance", add_int, ("size", S["size"], 5, 100, 1), None),
+        ("widget", "appearance", add_int, ("margin", S["margin"], 0, 100, 1), None),
+        ("widget", "appearance", add_int_slider, ("opacity", S["opacity"], 1, 100, 1), None),
+        ("widget", "appearance", add_int_slider, ("bg_opacity", S["bg_opacity"], 0, 100, 1), None),
+        ("widget", "appearance", add_list, ("indicator_shape", S["indicator_shape"]) + list_args, S["shape_opts"]),
+        ("widget", "appearance", add_list, ("bg_shape", S["bg_shape"]) + list_args, S["shape_opts"]),
+        ("widget", "appearance", add_int_slider, ("bg_size_percent", S["bg_size_percent"], 100, 500, 5), None),
+        ("group", None, "recording", "Recording Indicator"),
+        ("widget", "recording", add_list, ("corner_rec", "Position") + list_args, S["corner_opts"]),
+        ("widget", "recording", add_color, ("rec_color", S["rec_color"]), None),
+        ("widget", "recording", add_color, ("rec_pause_color", S["rec_pause_color"]), None),
+        ("group", None, "buffer", "Replay Buffer Indicator"),
+        ("widget", "buffer", add_list, ("corner_buf", "Position") + list_args, S["corner_opts"]),
+        ("widget", "buffer", add_color, ("buf_color", S["buf_color"]), None),
+        ("widget", "buffer", add_color, ("buf_saved_color", S["buf_saved_color"]), None),
+        ("widget", "buffer", add_float_slider, ("checkmark_duration", S["checkmark_duration"], 0.5, 5.0, 0.1), None),
+        ("widget", "buffer", add_path,
+         ("save_sound_path", S["save_sound_path"], obs.OBS_PATH_FILE, "Sound files (*.wav *.mp3 *.ogg *.flac)", None),
+         None),
+        ("widget", "buffer", add_int_slider, ("save_sound_volume", S["save_sound_volume"], 0, 200, 1), None),
+        ("group", None, "effects", "Effects & Animations"),
+        ("widget", "effects", add_bool, ("fade_effect", S["fade_effect"]), None),
+        ("widget", "effects", add_bool, ("smooth_position", S["smooth_position"]), None),
+        ("widget", "effects", add_bool, ("animate_pause", S["animate_pause"]), None),
+        ("widget", "effects", add_bool, ("animate_checkmark", S["animate_checkmark"]), None),
+        ("widget", "effects", add_bool, ("flash_on_save", S["flash_on_save"]), None),
+        ("widget", "effects", add_color, ("flash_color", S["flash_color"]), None),
+        ("widget", "effects", add_float_slider, ("flash_duration", S["flash_duration"], 0.1, 2.0, 0.1), None),
+        ("group", None, "borders", S["borders_group"]),
+        ("widget", "borders", add_int, ("border_width", S["border_width"], 1, 50, 1), None),
+        ("group", "borders", "rec_border", "Recording Border"),
+        ("widget", "rec_border", add_bool, ("rec_border_enabled", S["rec_border_enabled"]), None),
+        ("widget", "rec_border", add_color, ("rec_border_color", S["rec_border_color"]), None),
+        ("widget", "rec_border", add_color, ("rec_pause_border_color", S["rec_pause_border_color"]), None),
+        ("widget", "rec_border", add_bool, ("rec_pause_border_enabled", S["rec_pause_border_enabled"]), None),
+        ("group", "borders", "buf_border", "Replay Buffer Border"),
+        ("widget", "buf_border", add_bool, ("buf_border_enabled", S["buf_border_enabled"]), None),
+        ("widget", "buf_border", add_color, ("buf_border_color", S["buf_border_color"]), None),
+        ("widget", "buf_border", add_color, ("buf_save_border_color", S["buf_save_border_color"]), None),
+        ("widget", "buf_border", add_bool, ("buf_save_border_enabled", S["buf_save_border_enabled"]), None),
+    ]
+
 
-    def add_group(id_str: str, title: str, parent: Any = props) -> Any:
-        grp = obs.obs_properties_create()
-        obs.obs_properties_add_group(parent, id_str, title, obs.OBS_GROUP_NORMAL, grp)
-        return grp
-
-    app_grp = add_group("appearance", "Appearance")
-    obs.obs_properties_add_int(app_grp, "size", STRINGS["size"], 5, 100, 1)
-    obs.obs_properties_add_int(app_grp, "margin", STRINGS["margin"], 0, 100, 1)
-    obs.obs_properties_add_int_slider(app_grp, "opacity", STRINGS["opacity"], 1, 100, 1)
-    obs.obs_properties_add_int_slider(app_grp, "bg_opacity", STRINGS["bg_opacity"], 0, 100, 1)
-    shape_list = obs.obs_properties_add_list(app_grp, "indicator_shape", STRINGS["indicator_shape"],
-                                             obs.OBS_COMBO_TYPE_LIST, obs.OBS_COMBO_FORMAT_STRING)
-    _add_list_options(shape_list, STRINGS["shape_opts"])
-    bg_shape_list = obs.obs_properties_add_list(app_grp, "bg_shape", STRINGS["bg_shape"], obs.OBS_COMBO_TYPE_LIST,
-                                                obs.OBS_COMBO_FORMAT_STRING)
-    _add_list_options(bg_shape_list, STRINGS["shape_opts"])
-    obs.obs_properties_add_int_slider(app_grp, "bg_size_percent", STRINGS["bg_size_percent"], 100, 500, 5)
-
-    rec_grp = add_group("recording", "Recording Indicator")
-    corner_list_rec = obs.obs_properties_add_list(rec_grp, "corner_rec", "Position", obs.OBS_COMBO_TYPE_LIST,
-                                                  obs.OBS_COMBO_FORMAT_STRING)
-    _add_list_options(corner_list_rec, STRINGS["corner_opts"])
-    obs.obs_properties_add_color(rec_grp, "rec_color", STRINGS["rec_color"])
-    obs.obs_properties_add_color(rec_grp, "rec_pause_color", STRINGS["rec_pause_color"])
-
-    buf_grp = add_group("buffer", "Replay Buffer Indicator")
-    corner_list_buf = obs.obs_properties_add_list(buf_grp, "corner_buf", "Position", obs.OBS_COMBO_TYPE_LIST,
-                                                  obs.OBS_COMBO_FORMAT_STRING)
-    _add_list_options(corner_list_buf, STRINGS["corner_opts"])
-    obs.obs_properties_add_color(buf_grp, "buf_color", STRINGS["buf_color"])
-    obs.obs_properties_add_color(buf_grp, "buf_saved_color", STRINGS["buf_saved_color"])
-    obs.obs_properties_add_float_slider(buf_grp, "checkmark_duration", STRINGS["checkmark_duration"], 0.5, 5.0, 0.1)
-    obs.obs_properties_add_path(buf_grp, "save_sound_path", STRINGS["save_sound_path"], obs.OBS_PATH_FILE, "Sound files (*.wav *.mp3 *.ogg *.flac)", None)
-    obs.obs_properties_add_int_slider(buf_grp, "save_sound_volume", STRINGS["save_sound_volume"], 0, 200, 1)
-
-    fx_grp = add_group("effects", "Effects & Animations")
-    obs.obs_properties_add_bool(fx_grp, "fade_effect", STRINGS["fade_effect"])
-    obs.obs_properties_add_bool(fx_grp, "smooth_position", STRINGS["smooth_position"])
-    obs.obs_properties_add_bool(fx_grp, "animate_pause", STRINGS["animate_pause"])
-    obs.obs_properties_add_bool(fx_grp, "animate_checkmark", STRINGS["animate_checkmark"])
-    obs.obs_properties_add_bool(fx_grp, "flash_on_save", STRINGS["flash_on_save"])
-    obs.obs_properties_add_color(fx_grp, "flash_color", STRINGS["flash_color"])
-    obs.obs_properties_add_float_slider(fx_grp, "flash_duration", STRINGS["flash_duration"], 0.1, 2.0, 0.1)
-
-    border_grp = add_group("borders", STRINGS["borders_group"])
-    obs.obs_properties_add_int(border_grp, "border_width", STRINGS["border_width"], 1, 50, 1)
-    rec_border_grp = add_group("rec_border", "Recording Border", border_grp)
-    obs.obs_properties_add_bool(rec_border_grp, "rec_border_enabled", STRINGS["rec_border_enabled"])
-    obs.obs_properties_add_color(rec_border_grp, "rec_border_color", STRINGS["rec_border_color"])
-    obs.obs_properties_add_color(rec_border_grp, "rec_pause_border_color", STRINGS["rec_pause_border_color"])
-    obs.obs_properties_add_bool(rec_border_grp, "rec_pause_border_enabled", STRINGS["rec_pause_border_enabled"])
-    buf_border_grp = add_group("buf_border", "Replay Buffer Border", border_grp)
-    obs.obs_properties_add_bool(buf_border_grp, "buf_border_enabled", STRINGS["buf_border_enabled"])
-    obs.obs_properties_add_color(buf_border_grp, "buf_border_color", STRINGS["buf_border_color"])
-    obs.obs_properties_add_color(buf_border_grp, "buf_save_border_color", STRINGS["buf_save_border_color"])
-    obs.obs_properties_add_bool(buf_border_grp, "buf_save_border_enabled", STRINGS["buf_save_border_enabled"])
+def script_properties() -> Any:
+    global _property_specs
+    if _property_specs is None:
+        _property_specs = _build_property_specs()
 
+    props = obs.obs_properties_create()
+    groups: Dict[str, Any] = {}
+    for spec in _property_specs:
+        if spec[0] == "group":
+            _kind, parent_id, group_id, title = spec
+            grp = obs.obs_properties_create()
+            parent = groups[parent_id] if parent_id else props
+            obs.obs_properties_add_group(parent, group_id, title, obs.OBS_GROUP_NORMAL, grp)
+            groups[group_id] = grp
+        else:
+            _kind, group_id, add_fn, args, options = spec
+            prop = add_fn(groups[group_id], *args)
+            if options:
+                _add_list_options(prop, options)
     return props
 
 
 def script_defaults(settings_obj: Any) -> None:
-    for key, value in DEFAULT_SETTINGS.items():
-        if key.endswith("_color"):
-            obs.obs_data_set_default_int(settings_obj, key, rgb_to_obs_color(value))
-        elif isinstance(value, bool):
-            obs.obs_data_set_default_bool(settings_obj, key, value)
-        elif isinstance(value, float):
-            obs.obs_data_set_default_double(settings_obj, key, value)
-        elif isinstance(value, int):
-            obs.obs_data_set_default_int(settings_obj, key, value)
-        elif isinstance(value, str):
-            obs.obs_data_set_default_string(settings_obj, key, value)
+    for key, (_getter, set_default, default) in _SETTING_ACCESSORS.items():
+        set_default(settings_obj, key, default)
+
+
+_get_data_json = getattr(obs, "obs_data_get_json", None)
 
 
 def get_settings_from_obs(settings_obj: Any) -> Dict[str, Any]:
-    s = {}
-    for key, value in DEFAULT_SETTINGS.items():
-        if key.endswith("_color"):
-            s[key] = obs_color_to_rgb(obs.obs_data_get_int(settings_obj, key))
-        elif isinstance(value, bool):
-            s[key] = obs.obs_data_get_bool(settings_obj, key)
-        elif isinstance(value, float):
-            s[key] = obs.obs_data_get_double(settings_obj, key)
-        elif isinstance(value, int):
-            s[key] = obs.obs_data_get_int(settings_obj, key)
-        elif isinstance(value, str):
-            s[key] = obs.obs_data_get_string(settings_obj, key)
+    # One FFI crossing for the whole blob beats ~30 per-key shim calls.
+    # obs_data_get_json only serializes user-set values, so absent keys fall
+    # back to defaults (already in RGB space for colors).
+    if _get_data_json is not None:
+        try:
+            parsed = json.loads(_get_data_json(settings_obj) or "{}")
+        except ValueError:
+            parsed = None
+        if parsed is not None:
+            s = {key: parsed.get(key, default) for key, default in DEFAULT_SETTINGS.items()}
+            for key in _COLOR_KEYS:
+                if key in parsed:
+                    s[key] = obs_color_to_rgb(int(s[key]))
+            return s
+
+    s = {key: getter(settings_obj, key)
+         for key, (getter, _setter, _default) in _SETTING_ACCESSORS.items()}
+    for key in _COLOR_KEYS:
+        s[key] = obs_color_to_rgb(s[key])
     return s
 
 
+_last_settings: Dict[str, Any] = {}
+_pending_settings: Optional[Dict[str, Any]] = None
+_MISSING = object()
+
+
+def _flush_settings() -> None:
+    global _pending_settings
+    obs.timer_remove(_flush_settings)
+    pending, _pending_settings = _pending_settings, None
+    if pending is None or not (HAS_PYSIDE and overlay_app and overlay_app.emitter):
+        return
+    delta = {key: value for key, value in pending.items()
+             if _last_settings.get(key, _MISSING) != value}
+    if delta:
+        _last_settings.update(delta)
+        overlay_app.emitter.settings_updated.emit(delta)
+
+
 def script_update(settings_obj: Any) -> None:
-    if HAS_PYSIDE and overlay_app and overlay_app.emitter:
-        current_settings = get_settings_from_obs(settings_obj)
-        overlay_app.emitter.settings_updated.emit(current_settings)
+    global _pending_settings
+    if not (HAS_PYSIDE and overlay_app and overlay_app.emitter):
+        return
+    # OBS fires this on every property tweak; dragging a slider produces
+    # dozens per second. Park the latest snapshot and let a short timer
+    # forward only the last one in the burst.
+    start_timer = _pending_settings is None
+    _pending_settings = get_settings_from_obs(settings_obj)
+    if start_timer:
+        obs.timer_add(_flush_settings, Timeouts.SETTINGS_DEBOUNCE_MS)
 
 
 def script_load(settings_obj: Any) -> None:
-    global overlay_app, gui_thread
+    global overlay_app, gui_thread, _event_table
     if not HAS_PYSIDE:
         return
+    if overlay_app is not None:
+        log.warning("Overlay already running, ignoring duplicate script_load.")
+        return
 
     initial_settings = get_settings_from_obs(settings_obj)
+    _last_settings.clear()
+    _last_settings.update(initial_settings)
     obs.obs_frontend_add_event_callback(event_handler)
 
     overlay_app = OverlayApp(initial_settings)
+    _event_table = _build_event_table()
     gui_thread = threading.Thread(target=overlay_app.run, daemon=True)
     gui_thread.start()
 
-    obs.timer_add(_send_initial_state, Timeouts.INITIAL_STATE_DELAY_MS)
+    if overlay_app.gui_ready.wait(timeout=1.0):
+        _send_initial_state()
+    else:
+        # GUI thread is unusually slow to come up; retry on a short timer
+        # rather than dropping the startup state.
+        obs.timer_add(_send_initial_state, Timeouts.INITIAL_STATE_DELAY_MS)
 
 
 def _send_initial_state() -> None:
+    # obs.timer_add installs a repeating timer; remove ourselves first so
+    # this runs exactly once instead of polling the frontend forever.
+    obs.timer_remove(_send_initial_state)
     if overlay_app and overlay_app.emitter:
         rec_active = obs.obs_frontend_recording_active()
-        rec_paused = obs.obs_frontend_recording_paused() if rec_active else False
+        # Safe to query unconditionally; returns False when not recording.
+        rec_paused = obs.obs_frontend_recording_paused()
         buf_active = obs.obs_frontend_replay_buffer_active()
-        overlay_app.emitter.rec_status_changed.emit(rec_active, rec_paused)
-        overlay_app.emitter.buf_status_changed.emit(buf_active, False)
+        overlay_app.emitter.initial_state.emit(rec_active, rec_paused, buf_active)
 
 
 def script_unload() -> None:
-    global overlay_app, gui_thread
+    global overlay_app, gui_thread, _event_table
+    global _pending_settings
     obs.obs_frontend_remove_event_callback(event_handler)
+    obs.timer_remove(_flush_settings)
+    _pending_settings = None
+    _event_table = None
+    _last_emitted.clear()
+    _last_settings.clear()
     if HAS_PYSIDE and overlay_app:
         overlay_app.stop()
         if gui_thread:
-            gui_thread.join(Timeouts.THREAD_JOIN)
+            # Join in short slices instead of one long block so the OBS UI
+            # thread is not held for the full timeout if Qt teardown lags.
+            deadline = time.monotonic() + Timeouts.THREAD_JOIN
+            while gui_thread.is_alive() and time.monotonic() < deadline:
+                gui_thread.join(timeout=0.05)
+            if gui_thread.is_alive():
+                log.warning("GUI thread did not stop within %.1fs; leaving daemon thread to exit.",
+                            Timeouts.THREAD_JOIN)
         overlay_app = None
         gui_thread = None
     log.info("OBS Indicator script unloaded.")
+
+
+if not HAS_PYSIDE:
+    # Without PySide there is never anything to update; replace the handler
+    # outright so OBS property edits do not pay even the guard check.
+    def script_update(_settings_obj: Any) -> None:  # noqa: F811
+        pass